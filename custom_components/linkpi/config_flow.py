@@ -3,6 +3,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DOMAIN, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
 from .encoderapi import LinkPiEncoder
@@ -12,9 +13,9 @@ _LOGGER = logging.getLogger(__name__)
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
-async def _test_connection(host: str, username: str, password: str) -> None:
+async def _test_connection(hass, host: str, username: str, password: str) -> None:
     """Try logging into the LinkPi device to confirm credentials."""
-    encoder = LinkPiEncoder(host, username, password)
+    encoder = LinkPiEncoder(host, username, password, async_get_clientsession(hass))
     try:
         await encoder.login()
     except Exception:
@@ -34,6 +35,7 @@ class LinkpiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 await _test_connection(
+                    self.hass,
                     user_input[CONF_HOST],
                     user_input[CONF_USERNAME],
                     user_input[CONF_PASSWORD],
@@ -84,7 +86,7 @@ class LinkPiOptionsFlowHandler(config_entries.OptionsFlow):
                 username = self._config_entry.data[CONF_USERNAME]
                 password = self._config_entry.data[CONF_PASSWORD]
 
-                await _test_connection(host, username, password)
+                await _test_connection(self.hass, host, username, password)
 
                 return self.async_create_entry(
                     title="",
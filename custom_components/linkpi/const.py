@@ -10,3 +10,6 @@ CONF_SCAN_INTERVAL = "scan_interval"
 
 # Defaults
 DEFAULT_SCAN_INTERVAL = 60  # seconds
+
+# hass.data key for the fleet-wide aggregate shared by all entries
+DATA_FLEET = f"{DOMAIN}_fleet"
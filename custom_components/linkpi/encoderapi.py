@@ -5,7 +5,6 @@ import hashlib
 import logging
 import os
 import json
-import aiohttp
 import asyncio
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
@@ -13,11 +12,11 @@ _LOGGER = logging.getLogger(__name__)
 _REQUEST_TIMEOUT = 10  # seconds
 
 class LinkPiEncoder:
-    def __init__(self, host, username, password):
+    def __init__(self, host, username, password, session):
         self._host = host
         self._username = username
         self._password = password
-        self._session = aiohttp.ClientSession()
+        self._session = session  # shared aiohttp session, owned by the caller
         self._login_data = None
         self._digest_challenge = None
 
@@ -226,8 +225,8 @@ class LinkPiEncoder:
             _LOGGER.warning("Logout error: %s", err)
 
     async def close(self):
+        # The session is shared, so only the device-side login is torn down here
         await self.logout()
-        await self._session.close()
 
     @staticmethod
     def parse_www_authenticate(header):
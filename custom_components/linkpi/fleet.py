@@ -0,0 +1,143 @@
+"""Fleet-wide aggregate of all LinkPi entries, maintained incrementally."""
+
+import heapq
+from collections import Counter
+
+from homeassistant.core import callback
+
+from .parsing import parse_states
+
+# (tx, rx, temperature, inputs_down, unreachable)
+_EMPTY = (0, 0, None, 0, 0)
+_UNREACHABLE = (0, 0, None, 0, 1)
+
+def fleet_contribution(coordinator):
+    """
+    Reduce one coordinator's latest state to its share of the fleet totals.
+    Returns (tx, rx, temperature, inputs_down, unreachable).
+    """
+    if not coordinator.last_update_success or not isinstance(coordinator.data, dict):
+        return _UNREACHABLE
+
+    state = parse_states(coordinator.data)
+    tx = state["net_tx_rate"]
+    rx = state["net_rx_rate"]
+    temp = state["system_temp"]
+    inputs_down = any(
+        not vi_input.get("avalible") for vi_input in coordinator.data.get("video_input", [])
+    )
+
+    return (
+        tx if isinstance(tx, (int, float)) else 0,
+        rx if isinstance(rx, (int, float)) else 0,
+        temp if isinstance(temp, (int, float)) else None,
+        int(inputs_down),
+        0,
+    )
+
+class LinkPiFleet:
+    """
+    Fleet-wide totals across all LinkPi entries.
+    Each coordinator update swaps that entry's previous contribution for its
+    new one, so totals are adjusted by the delta instead of re-summed.
+    Entries that are retrying setup have no coordinator yet and count as
+    unreachable until one is attached.
+    """
+
+    def __init__(self):
+        self._contributions = {}
+        self._tracked = set()
+        self._listeners = []
+        # Max temperature: live count per value plus a max-heap (negated) of
+        # candidates; values whose count dropped to 0 are discarded lazily.
+        self._temp_counts = Counter()
+        self._temp_heap = []
+        self.totals = {
+            "fleet_tx_rate": 0,
+            "fleet_rx_rate": 0,
+            "fleet_max_temp": None,
+            "fleet_inputs_down": 0,
+            "fleet_unreachable": 0,
+        }
+
+    @callback
+    def async_set_retrying(self, entry_id, retrying):
+        """Count an entry without a coordinator as unreachable while it retries setup."""
+        if entry_id in self._tracked:
+            return
+        self._apply(entry_id, _UNREACHABLE if retrying else None)
+
+    @callback
+    def async_track(self, entry_id, coordinator):
+        """Follow a coordinator's updates; returns a callback that stops tracking."""
+
+        @callback
+        def _handle_update():
+            self._apply(entry_id, fleet_contribution(coordinator))
+
+        self._tracked.add(entry_id)
+        remove_listener = coordinator.async_add_listener(_handle_update)
+        _handle_update()
+
+        @callback
+        def _untrack():
+            remove_listener()
+            self._tracked.discard(entry_id)
+            self._apply(entry_id, None)
+
+        return _untrack
+
+    @callback
+    def async_add_listener(self, update_callback):
+        """Register a callback run whenever a fleet total changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove():
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    def _apply(self, entry_id, new):
+        old = self._contributions.get(entry_id, _EMPTY)
+        if new is None:
+            self._contributions.pop(entry_id, None)
+            new = _EMPTY
+        else:
+            self._contributions[entry_id] = new
+
+        if new == old:
+            return
+
+        totals = self.totals
+        totals["fleet_tx_rate"] += new[0] - old[0]
+        totals["fleet_rx_rate"] += new[1] - old[1]
+        totals["fleet_inputs_down"] += new[3] - old[3]
+        totals["fleet_unreachable"] += new[4] - old[4]
+        if new[2] != old[2]:
+            self._move_temp(old[2], new[2])
+
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def _move_temp(self, old, new):
+        counts = self._temp_counts
+        heap = self._temp_heap
+        if old is not None:
+            counts[old] -= 1
+            if not counts[old]:
+                del counts[old]
+        if new is not None:
+            if not counts[new]:
+                heapq.heappush(heap, -new)
+            counts[new] += 1
+
+        while heap and -heap[0] not in counts:
+            heapq.heappop(heap)
+        # Stale values below the max are never popped; rebuild once they
+        # dominate so the heap stays proportional to the live values.
+        if len(heap) > 2 * len(counts) + 8:
+            self._temp_heap = heap = [-temp for temp in counts]
+            heapq.heapify(heap)
+
+        self.totals["fleet_max_temp"] = -heap[0] if heap else None
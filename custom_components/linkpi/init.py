@@ -1,34 +1,70 @@
 import logging
 from datetime import timedelta
 
-from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.update_coordinator import UpdateFailed
-
-from .const import DOMAIN, DEFAULT_SCAN_INTERVAL, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.config_entries import (
+    SIGNAL_CONFIG_ENTRY_CHANGED,
+    ConfigEntry,
+    ConfigEntryChange,
+    ConfigEntryState,
+)
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, DATA_FLEET, DEFAULT_SCAN_INTERVAL, CONF_HOST, CONF_USERNAME, CONF_PASSWORD, CONF_SCAN_INTERVAL
 from .encoderapi import LinkPiEncoder
 from .coordinator import LinkPiCoordinator
+from .fleet import LinkPiFleet
 
 PLATFORMS = ["sensor"]
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up the fleet-wide aggregate sensors shared by all LinkPi entries."""
+    fleet = hass.data[DATA_FLEET] = LinkPiFleet()
+
+    @callback
+    def _async_entry_changed(change: ConfigEntryChange, entry: ConfigEntry) -> None:
+        # Entries failing setup never get a coordinator, so the fleet learns about
+        # them from their state. Unload/disable of a retrying entry only cancels the
+        # retry (no async_unload_entry), which arrives here as NOT_LOADED.
+        if entry.domain != DOMAIN or entry.state is ConfigEntryState.SETUP_IN_PROGRESS:
+            # Keep whatever the previous state implied across retry attempts
+            return
+        retrying = (
+            change is not ConfigEntryChange.REMOVED
+            and entry.state is ConfigEntryState.SETUP_RETRY
+            and entry.disabled_by is None
+        )
+        fleet.async_set_retrying(entry.entry_id, retrying)
+
+    async_dispatcher_connect(hass, SIGNAL_CONFIG_ENTRY_CHANGED, _async_entry_changed)
+    hass.async_create_task(async_load_platform(hass, "sensor", DOMAIN, {}, config))
+    return True
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up LinkPi integration from a config entry."""
     hass.data.setdefault(DOMAIN, {})
+    fleet: LinkPiFleet = hass.data[DATA_FLEET]
 
     host = entry.data[CONF_HOST]
     username = entry.data[CONF_USERNAME]
     password = entry.data[CONF_PASSWORD]
     scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
 
-    encoder = LinkPiEncoder(host, username, password)
+    encoder = LinkPiEncoder(host, username, password, async_get_clientsession(hass))
 
     try:
         await encoder.login()
         _LOGGER.info("LinkPi Encoder login executed successfully at setup.")
     except Exception as e:
-        _LOGGER.error(f"Failed to login to LinkPi Encoder during setup: {e}")
-        return False
+        # Retried by HA; counted as an unreachable encoder in the fleet meanwhile
+        raise ConfigEntryNotReady(f"Failed to login to LinkPi Encoder at {host}: {e}") from e
 
     coordinator = LinkPiCoordinator(hass, encoder, host, timedelta(seconds=scan_interval))
     await coordinator.async_config_entry_first_refresh()
@@ -38,6 +74,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "coordinator": coordinator,
     }
 
+    # Replaces any retry placeholder; untracked again when the entry unloads
+    entry.async_on_unload(fleet.async_track(entry.entry_id, coordinator))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     # Listen for options updates
@@ -68,3 +107,4 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if data and "encoder" in data:
             await data["encoder"].close()
     return unload_ok
+
@@ -0,0 +1,51 @@
+"""Parsing of raw LinkPi coordinator data, shared by the sensor platform and the fleet."""
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+SENSOR_TYPES = {
+    "system_cpu": ["CPU Usage", "%"],
+    "system_mem": ["Memory Usage", "%"],
+    "system_temp": ["Core Temperature", "°C"],
+    "net_tx_rate": ["Network TX Rate", "kbps"],
+    "net_rx_rate": ["Network RX Rate", "kbps"],
+}
+
+def parse_states(states):
+    """
+    Parse raw coordinator data into a flat dict of sensor values.
+    Negative network rates are considered invalid and are clamped to 0.
+    """
+    if not isinstance(states, dict):
+        return {key: None for key in SENSOR_TYPES}
+
+    sys_data = states.get("system", {})
+    net_data = states.get("network", {})
+
+    tx = net_data.get("tx")
+    rx = net_data.get("rx")
+
+    # Simple clamping logic to prevent erronous values being recorded
+    corrected_tx = False
+    corrected_rx = False
+
+    if isinstance(tx, (int, float)) and tx < 0:
+        _LOGGER.debug("Clamping negative net_tx_rate value %s to 0", tx)
+        tx = 0
+        corrected_tx = True
+
+    if isinstance(rx, (int, float)) and rx < 0:
+        _LOGGER.debug("Clamping negative net_rx_rate value %s to 0", rx)
+        rx = 0
+        corrected_rx = True
+
+    parsed = {
+        "system_cpu": sys_data.get("cpu"),
+        "system_mem": sys_data.get("mem"),
+        "system_temp": sys_data.get("temperature"),
+        "net_tx_rate": tx,
+        "net_rx_rate": rx,
+    }
+
+    return parsed
@@ -2,55 +2,29 @@ import logging
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, DATA_FLEET
+from .parsing import SENSOR_TYPES, parse_states
 
 _LOGGER = logging.getLogger(__name__)
 
-SENSOR_TYPES = {
-    "system_cpu": ["CPU Usage", "%"],
-    "system_mem": ["Memory Usage", "%"],
-    "system_temp": ["Core Temperature", "°C"],
-    "net_tx_rate": ["Network TX Rate", "kbps"],
-    "net_rx_rate": ["Network RX Rate", "kbps"],
+FLEET_SENSOR_TYPES = {
+    "fleet_tx_rate": ["Fleet Network TX Rate", "kbps"],
+    "fleet_rx_rate": ["Fleet Network RX Rate", "kbps"],
+    "fleet_max_temp": ["Fleet Max Core Temperature", "°C"],
+    "fleet_inputs_down": ["Fleet Encoders With Input Down", None],
+    "fleet_unreachable": ["Fleet Unreachable Encoders", None],
 }
 
-def parse_states(states):
-    """
-    Parse raw coordinator data into a flat dict of sensor values.
-    Negative network rates are considered invalid and are clamped to 0.
-    """
-    if not isinstance(states, dict):
-        return {key: None for key in SENSOR_TYPES}
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Set up the fleet-wide aggregate sensors (loaded once via discovery)."""
+    if discovery_info is None:
+        return
 
-    sys_data = states.get("system", {})
-    net_data = states.get("network", {})
-
-    tx = net_data.get("tx")
-    rx = net_data.get("rx")
-
-    # Simple clamping logic to prevent erronous values being recorded
-    corrected_tx = False
-    corrected_rx = False
-
-    if isinstance(tx, (int, float)) and tx < 0:
-        _LOGGER.debug("Clamping negative net_tx_rate value %s to 0", tx)
-        tx = 0
-        corrected_tx = True
-
-    if isinstance(rx, (int, float)) and rx < 0:
-        _LOGGER.debug("Clamping negative net_rx_rate value %s to 0", rx)
-        rx = 0
-        corrected_rx = True
-
-    parsed = {
-        "system_cpu": sys_data.get("cpu"),
-        "system_mem": sys_data.get("mem"),
-        "system_temp": sys_data.get("temperature"),
-        "net_tx_rate": tx,
-        "net_rx_rate": rx,
-    }
-
-    return parsed
+    fleet = hass.data[DATA_FLEET]
+    async_add_entities(
+        LinkPiFleetSensor(fleet, key, name, unit)
+        for key, (name, unit) in FLEET_SENSOR_TYPES.items()
+    )
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
@@ -84,6 +58,27 @@ class LinkPiSensor(CoordinatorEntity, SensorEntity):
     def available(self):
         return self.coordinator.data is not None
 
+class LinkPiFleetSensor(SensorEntity):
+    _attr_should_poll = False
+
+    def __init__(self, fleet, key, name, unit):
+        self._fleet = fleet
+        self._attr_name = f"LinkPi {name}"
+        self._attr_unique_id = f"{DOMAIN}_{key}"
+        self._key = key
+        self._attr_native_unit_of_measurement = unit
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self._fleet.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self):
+        value = self._fleet.totals[self._key]
+        if isinstance(value, float):
+            # Totals are built from repeated deltas; hide float drift
+            return round(value, 2)
+        return value
+
 class LinkPiVideoInputSensor(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, vi_input):
         super().__init__(coordinator)
@@ -0,0 +1,182 @@
+"""Startup benchmark for the LinkPi integration.
+
+Measures how long importing the integration's modules takes and, for a growing
+number of entries set up concurrently, each entry's time to first entity: from
+calling the integration's async_setup_entry (login, LinkPiCoordinator first
+refresh, fleet registration) until the sensor platform hands its entities to
+async_add_entities. Runs on a bare HomeAssistant instance against a local fake
+LinkPi device that challenges unauthenticated requests the way the real one
+does, so no hardware is needed.
+
+HA's loader is not bootstrapped, so two pieces are substituted: platform
+forwarding calls the sensor platform's async_setup_entry directly, and the
+fleet object normally created by async_setup (which also loads the fleet
+sensors via discovery) is created here.
+
+Usage (from the repository root, with Home Assistant installed):
+    python scripts/bench_startup.py --entries 1 10 50 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+from aiohttp import web
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# HA core is imported first so only the integration's own modules are timed
+_IMPORT_PROBE = """
+import time
+import homeassistant.helpers.update_coordinator, homeassistant.config_entries
+start = time.perf_counter()
+import custom_components.linkpi.init
+integration = time.perf_counter() - start
+start = time.perf_counter()
+import custom_components.linkpi.sensor
+print(integration, time.perf_counter() - start)
+"""
+
+_CHALLENGE = 'Digest realm="LinkPi", nonce="0123456789abcdef", qop="auth", opaque="fedcba9876543210"'
+
+_STATES = {
+    "/link/system/get_sys_state": {"cpu": 12, "mem": 34, "temperature": 48},
+    "/link/system/get_net_state": {"tx": 4000, "rx": 120},
+    "/link/system/get_vi_state": [
+        {"chnId": 0, "name": "HDMI", "protocol": "HDMI", "avalible": True},
+    ],
+}
+
+
+def build_fake_device(latency: float) -> web.Application:
+    """A minimal LinkPi device: digest-challenged login plus the three state endpoints."""
+
+    def challenge():
+        return web.Response(status=401, headers={"WWW-Authenticate": _CHALLENGE})
+
+    async def login(request):
+        await asyncio.sleep(latency)
+        if "Authorization" not in request.headers:
+            return challenge()
+        return web.json_response({
+            "status": "success",
+            "data": {"L-HASH": "l", "P-HASH": "p", "H-HASH": "h", "Cookie": "c"},
+        })
+
+    async def state(request):
+        await asyncio.sleep(latency)
+        if "Authorization" not in request.headers or "L-HASH" not in request.headers:
+            return challenge()
+        return web.json_response({"status": "success", "data": _STATES[request.path]})
+
+    async def logout(request):
+        return web.json_response({"status": "success", "data": {}})
+
+    app = web.Application()
+    app.router.add_post("/link/user/lph_login", login)
+    app.router.add_post("/link/user/lph_logout", logout)
+    for path in _STATES:
+        app.router.add_post(path, state)
+    return app
+
+
+def measure_import() -> tuple[float, float]:
+    """Import the integration in a fresh interpreter so nothing is already cached."""
+    out = subprocess.check_output([sys.executable, "-c", _IMPORT_PROBE], cwd=REPO_ROOT, text=True)
+    integration, platform = out.split()
+    return float(integration), float(platform)
+
+
+async def time_to_first_entities(host: str, count: int) -> tuple[list[float], float]:
+    """
+    Set up `count` entries concurrently on a fresh HomeAssistant.
+    Returns the seconds until each entry's entities were added, and the wall time for all of them.
+    """
+    from homeassistant.config_entries import ConfigEntries, ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from custom_components.linkpi import init, sensor
+    from custom_components.linkpi.const import DOMAIN, DATA_FLEET, CONF_HOST, CONF_USERNAME, CONF_PASSWORD
+    from custom_components.linkpi.fleet import LinkPiFleet
+
+    hass = HomeAssistant(REPO_ROOT)
+    hass.config_entries = ConfigEntries(hass, {})
+    hass.data[DATA_FLEET] = LinkPiFleet()
+    entities_added = {}
+
+    async def forward_entry_setups(entry, platforms):
+        def add_entities(entities):
+            entities_added[entry.entry_id] = time.perf_counter()
+
+        await sensor.async_setup_entry(hass, entry, add_entities)
+
+    hass.config_entries.async_forward_entry_setups = forward_entry_setups
+
+    async def setup(entry):
+        start = time.perf_counter()
+        await init.async_setup_entry(hass, entry)
+        return entities_added[entry.entry_id] - start
+
+    entries = [
+        ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title=host,
+            data={CONF_HOST: host, CONF_USERNAME: "admin", CONF_PASSWORD: "admin"},
+            source="user",
+            entry_id=uuid.uuid4().hex,
+        )
+        for _ in range(count)
+    ]
+    try:
+        start = time.perf_counter()
+        timings = await asyncio.gather(*(setup(entry) for entry in entries))
+        return timings, time.perf_counter() - start
+    finally:
+        for data in hass.data.get(DOMAIN, {}).values():
+            await data["coordinator"].async_shutdown()
+        await hass.async_stop(force=True)
+
+
+async def run(entry_counts: list[int], latency: float) -> None:
+    runner = web.AppRunner(build_fake_device(latency))
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    host = f"127.0.0.1:{runner.addresses[0][1]}"
+
+    try:
+        integration, platform = measure_import()
+        print(f"import integration (init.py): {integration * 1000:.1f} ms, "
+              f"sensor platform: {platform * 1000:.1f} ms")
+
+        print("time to first entity per entry (async_setup_entry -> sensor entities added):")
+        print(f"{'entries':>8} {'wall ms':>9} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}")
+        for count in entry_counts:
+            timings, wall = await time_to_first_entities(host, count)
+            timings = sorted(timings)
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(f"{count:>8} {wall * 1000:>9.1f} {statistics.mean(timings) * 1000:>9.1f} "
+                  f"{p95 * 1000:>9.1f} {timings[-1] * 1000:>9.1f}")
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[1, 10, 50],
+                        help="number of LinkPi entries to set up concurrently")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="artificial per-request latency of the fake device (seconds)")
+    args = parser.parse_args()
+    asyncio.run(run(args.entries, args.latency))
+
+
+if __name__ == "__main__":
+    main()
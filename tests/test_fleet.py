@@ -0,0 +1,167 @@
+"""Tests for the incrementally maintained fleet totals."""
+
+from custom_components.linkpi.fleet import LinkPiFleet
+
+
+class StubCoordinator:
+    """Just enough of a DataUpdateCoordinator for LinkPiFleet.async_track."""
+
+    def __init__(self, temperature=50, tx=100, rx=10, inputs=(True,)):
+        self.last_update_success = True
+        self.data = None
+        self._listeners = []
+        self.set_state(temperature, tx, rx, inputs)
+
+    def set_state(self, temperature=50, tx=100, rx=10, inputs=(True,)):
+        self.data = {
+            "system": {"temperature": temperature},
+            "network": {"tx": tx, "rx": rx},
+            "video_input": [{"chnId": i, "avalible": up} for i, up in enumerate(inputs)],
+        }
+
+    def async_add_listener(self, update_callback):
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    def update(self, **state):
+        if state:
+            self.set_state(**state)
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+def _fleet_with_listener():
+    fleet = LinkPiFleet()
+    calls = []
+    fleet.async_add_listener(lambda: calls.append(dict(fleet.totals)))
+    return fleet, calls
+
+
+def test_retrying_entry_hands_off_to_coordinator():
+    fleet, _ = _fleet_with_listener()
+    fleet.async_set_retrying("a", True)
+    assert fleet.totals["fleet_unreachable"] == 1
+
+    untrack = fleet.async_track("a", StubCoordinator(temperature=40, tx=100, rx=5, inputs=(True, False)))
+    assert fleet.totals == {
+        "fleet_tx_rate": 100,
+        "fleet_rx_rate": 5,
+        "fleet_max_temp": 40,
+        "fleet_inputs_down": 1,
+        "fleet_unreachable": 0,
+    }
+
+    # State changes of a tracked entry don't disturb its coordinator's contribution
+    fleet.async_set_retrying("a", True)
+    assert fleet.totals["fleet_unreachable"] == 0
+
+    untrack()
+    assert fleet.totals == {
+        "fleet_tx_rate": 0,
+        "fleet_rx_rate": 0,
+        "fleet_max_temp": None,
+        "fleet_inputs_down": 0,
+        "fleet_unreachable": 0,
+    }
+
+
+def test_retrying_entry_dropped_when_no_longer_retrying():
+    fleet, _ = _fleet_with_listener()
+    fleet.async_set_retrying("a", True)
+    fleet.async_set_retrying("b", True)
+    assert fleet.totals["fleet_unreachable"] == 2
+
+    fleet.async_set_retrying("a", False)
+    assert fleet.totals["fleet_unreachable"] == 1
+
+
+def test_failed_update_counts_as_unreachable():
+    fleet, _ = _fleet_with_listener()
+    coordinator = StubCoordinator(temperature=40, tx=100, rx=5)
+    fleet.async_track("a", coordinator)
+
+    coordinator.last_update_success = False
+    coordinator.update()
+    assert fleet.totals["fleet_unreachable"] == 1
+    assert fleet.totals["fleet_tx_rate"] == 0
+    assert fleet.totals["fleet_max_temp"] is None
+
+    coordinator.last_update_success = True
+    coordinator.update()
+    assert fleet.totals["fleet_unreachable"] == 0
+    assert fleet.totals["fleet_tx_rate"] == 100
+
+
+def test_max_temp_follows_hottest_encoder():
+    fleet, _ = _fleet_with_listener()
+    hot = StubCoordinator(temperature=70)
+    warm = StubCoordinator(temperature=50)
+    untrack_hot = fleet.async_track("hot", hot)
+    fleet.async_track("warm", warm)
+    assert fleet.totals["fleet_max_temp"] == 70
+
+    hot.update(temperature=69)
+    assert fleet.totals["fleet_max_temp"] == 69
+
+    hot.update(temperature=None)
+    assert fleet.totals["fleet_max_temp"] == 50
+
+    hot.update(temperature=80)
+    assert fleet.totals["fleet_max_temp"] == 80
+
+    untrack_hot()
+    assert fleet.totals["fleet_max_temp"] == 50
+
+
+def test_max_temp_with_duplicate_values():
+    fleet, _ = _fleet_with_listener()
+    a = StubCoordinator(temperature=60)
+    b = StubCoordinator(temperature=60)
+    fleet.async_track("a", a)
+    fleet.async_track("b", b)
+
+    a.update(temperature=40)
+    assert fleet.totals["fleet_max_temp"] == 60
+    b.update(temperature=30)
+    assert fleet.totals["fleet_max_temp"] == 40
+
+
+def test_noisy_temperature_keeps_heap_bounded():
+    fleet, _ = _fleet_with_listener()
+    noisy = StubCoordinator(temperature=50)
+    fleet.async_track("noisy", noisy)
+    fleet.async_track("hot", StubCoordinator(temperature=90))
+
+    for step in range(1000):
+        noisy.update(temperature=40 + step % 7 + step / 1000)
+
+    assert fleet.totals["fleet_max_temp"] == 90
+    assert len(fleet._temp_heap) <= 2 * len(fleet._temp_counts) + 8
+
+
+def test_unchanged_update_does_not_notify():
+    fleet, calls = _fleet_with_listener()
+    coordinator = StubCoordinator(temperature=40)
+    fleet.async_track("a", coordinator)
+    assert len(calls) == 1
+
+    coordinator.update()
+    assert len(calls) == 1
+
+    coordinator.update(temperature=41)
+    assert len(calls) == 2
+
+
+def test_totals_sum_across_entries_and_clamp_negative_rates():
+    fleet, _ = _fleet_with_listener()
+    a = StubCoordinator(tx=100, rx=-5, inputs=(True, False))
+    b = StubCoordinator(tx=1.5, rx=3, inputs=(True,))
+    fleet.async_track("a", a)
+    fleet.async_track("b", b)
+    assert fleet.totals["fleet_tx_rate"] == 101.5
+    assert fleet.totals["fleet_rx_rate"] == 3
+    assert fleet.totals["fleet_inputs_down"] == 1
+
+    b.update(tx=2, rx=3, inputs=(False,))
+    assert fleet.totals["fleet_tx_rate"] == 102
+    assert fleet.totals["fleet_inputs_down"] == 2